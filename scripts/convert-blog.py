@@ -1,7 +1,11 @@
 import re
 import os
 import json
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
+from xml.sax.saxutils import escape
 
 # Read SQL file
 with open('claudedocs/blog-backup/blog_posts_rows.sql', 'r', encoding='utf-8') as f:
@@ -90,7 +94,72 @@ def parse_sql_row(row_str):
 
     return [clean_sql_value(f) for f in fields]
 
+# ---------------------------------------------------------------------------
+# SEO files (sitemap.xml / rss.xml)
+#
+# scripts/generate-seo.js renders the same files from the same records and
+# settings (scripts/seo-config.json); keep both templates byte-identical.
+# ---------------------------------------------------------------------------
+
+public_dir = Path('public')
+seo_config_path = Path('scripts/seo-config.json')
+seo_state_path = Path('scripts/.seo-fingerprint')
+
+seo_config_bytes = seo_config_path.read_bytes()
+seo_config = json.loads(seo_config_bytes)
+SITE_DOMAIN = seo_config['siteDomain']
+
+def sha256_hex(data):
+    return hashlib.sha256(data).hexdigest()
+
+def parse_timestamp(value):
+    """Parse a Postgres timestamptz string ('2025-04-23 13:38:57.694308+00') into a UTC datetime"""
+    value = value.strip().replace(' ', 'T', 1)
+    # Postgres writes hour-only offsets ('+00', '+09'); fromisoformat wants '+HH:MM'
+    value = re.sub(r'([+-]\d{2})$', r'\1:00', value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def canonical_timestamp(value):
+    """Same format as JavaScript's Date.toISOString() ('2025-04-23T13:38:57.694Z')"""
+    return value.strftime('%Y-%m-%dT%H:%M:%S.') + f"{value.microsecond // 1000:03d}Z"
+
+def rfc822_date(timestamp):
+    parsed = datetime.strptime(timestamp[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+    return format_datetime(parsed, usegmt=True)
+
+def xml_escape(value):
+    """Escape text for XML element content and attribute values"""
+    return escape(value, {'"': '&quot;', "'": '&apos;'})
+
+def strip_markdown(md):
+    """Reduce markdown/HTML to plain text for RSS descriptions"""
+    text = re.sub(r'```[\s\S]*?```', '', md)
+    text = re.sub(r'!\[[^\]]*\]\([^)]+\)', '', text)
+    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    text = re.sub(r'`([^`]+)`', r'\1', text)
+    text = re.sub(r'<[^>]*>', '', text)
+    text = re.sub(r'[*_~>#]', '', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+def make_description(excerpt):
+    limit = seo_config['descriptionMaxLength']
+    description = strip_markdown(excerpt)
+    return description[:limit] + '...' if len(description) > limit else description
+
+def resolve_cover_image(cover_image):
+    if not cover_image:
+        return ''
+    if cover_image.startswith('http'):
+        return cover_image
+    if cover_image.startswith('/'):
+        return f"{SITE_DOMAIN}{cover_image}"
+    return f"{SITE_DOMAIN}/blog-images/{cover_image}"
+
 count = 0
+seo_records = {}
 for idx, match in enumerate(matches):
     try:
         fields = parse_sql_row(match)
@@ -127,6 +196,28 @@ slug: "{slug}"
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(frontmatter)
 
+        # SEO record for this file; None keeps it out of sitemap/RSS
+        seo_post = None
+        if slug and published_at:
+            try:
+                published = parse_timestamp(published_at)
+                updated = parse_timestamp(updated_at) if updated_at else published
+            except ValueError as e:
+                print(f"[ERROR] Post {idx + 1} left out of SEO files - bad timestamp: {e}")
+            else:
+                seo_post = {
+                    'slug': slug,
+                    'title': title or '',
+                    'description': make_description(excerpt or ''),
+                    'category': category or seo_config['defaultCategory'],
+                    'author': author_name or seo_config['defaultAuthor'],
+                    'coverImage': resolve_cover_image(cover_image),
+                    'tags': [],
+                    'publishedAt': canonical_timestamp(published),
+                    'updatedAt': canonical_timestamp(updated),
+                }
+        seo_records[filename] = {'digest': sha256_hex(filepath.read_bytes()), 'post': seo_post}
+
         count += 1
         print(f"[OK] {count}. Created: {filename}")
 
@@ -135,3 +226,189 @@ slug: "{slug}"
 
 print(f"\nSuccessfully converted {count} posts!")
 print(f"Files saved to: {output_dir}")
+
+# ---------------------------------------------------------------------------
+# Render sitemap/RSS from the records
+# ---------------------------------------------------------------------------
+
+def sort_posts(posts):
+    """Newest first, slug as tie-breaker (same order as generate-seo.js)"""
+    posts = sorted(posts, key=lambda p: p['slug'])
+    return sorted(posts, key=lambda p: p['publishedAt'], reverse=True)
+
+def iter_sitemap_urls(posts, static_lastmod):
+    """Yield (loc, lastmod, changefreq, priority) for every sitemap entry"""
+    for page in seo_config['staticUrls']:
+        yield f"{SITE_DOMAIN}{page['path']}", static_lastmod, page['changefreq'], page['priority']
+    for post in posts:
+        yield (f"{SITE_DOMAIN}/blog/{post['slug']}", post['updatedAt'][:10],
+               seo_config['post']['changefreq'], seo_config['post']['priority'])
+
+def write_urlset(path, urls):
+    """Stream a <urlset> file; returns the number of URLs written"""
+    written = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for loc, lastmod, changefreq, priority in urls:
+            f.write(
+                f"  <url>\n"
+                f"    <loc>{xml_escape(loc)}</loc>\n"
+                f"    <lastmod>{lastmod}</lastmod>\n"
+                f"    <changefreq>{changefreq}</changefreq>\n"
+                f"    <priority>{priority}</priority>\n"
+                f"  </url>\n"
+            )
+            written += 1
+        f.write('</urlset>\n')
+    return written
+
+def write_sitemaps(posts, static_lastmod):
+    """Write sitemap.xml, or a sitemap index plus sitemap-N.xml shards past sitemapMaxUrls.
+
+    Returns the paths of every file written.
+    """
+    for stale in public_dir.glob('sitemap-*.xml'):
+        stale.unlink()
+
+    max_urls = seo_config['sitemapMaxUrls']
+    total = len(seo_config['staticUrls']) + len(posts)
+    sitemap_path = public_dir / 'sitemap.xml'
+    if total <= max_urls:
+        write_urlset(sitemap_path, iter_sitemap_urls(posts, static_lastmod))
+        print(f"[OK] Sitemap saved: {sitemap_path} ({total} URLs)")
+        return [sitemap_path]
+
+    urls = iter_sitemap_urls(posts, static_lastmod)
+    shard_count = (total + max_urls - 1) // max_urls
+    written_paths = [sitemap_path]
+    with open(sitemap_path, 'w', encoding='utf-8', newline='\n') as index:
+        index.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        index.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for shard in range(1, shard_count + 1):
+            shard_urls = (url for _, url in zip(range(max_urls), urls))
+            shard_path = public_dir / f'sitemap-{shard}.xml'
+            written = write_urlset(shard_path, shard_urls)
+            written_paths.append(shard_path)
+            index.write(
+                f"  <sitemap>\n"
+                f"    <loc>{SITE_DOMAIN}/{shard_path.name}</loc>\n"
+                f"    <lastmod>{static_lastmod}</lastmod>\n"
+                f"  </sitemap>\n"
+            )
+            print(f"[OK] Sitemap shard saved: {shard_path} ({written} URLs)")
+        index.write('</sitemapindex>\n')
+    print(f"[OK] Sitemap index saved: {sitemap_path} ({shard_count} shards, {total} URLs)")
+    return written_paths
+
+def write_rss(posts, build_timestamp):
+    """Stream rss.xml with the rssMaxItems most recent posts"""
+    rss_path = public_dir / 'rss.xml'
+    channel = seo_config['channel']
+    build_date = rfc822_date(build_timestamp)
+    items = posts[:seo_config['rssMaxItems']]
+    with open(rss_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+                'xmlns:atom="http://www.w3.org/2005/Atom" xmlns:dc="http://purl.org/dc/elements/1.1/">\n')
+        f.write('  <channel>\n')
+        f.write(f"    <title>{xml_escape(channel['title'])}</title>\n")
+        f.write(f"    <link>{SITE_DOMAIN}</link>\n")
+        f.write(f"    <description>{xml_escape(channel['description'])}</description>\n")
+        f.write(f"    <language>{channel['language']}</language>\n")
+        f.write(f"    <lastBuildDate>{build_date}</lastBuildDate>\n")
+        f.write(f"    <pubDate>{build_date}</pubDate>\n")
+        f.write(f"    <ttl>{channel['ttl']}</ttl>\n")
+        f.write(f'    <atom:link href="{SITE_DOMAIN}/rss.xml" rel="self" type="application/rss+xml"/>\n')
+        f.write(f"    <managingEditor>{xml_escape(channel['managingEditor'])}</managingEditor>\n")
+        f.write(f"    <copyright>Copyright {build_timestamp[:4]} {xml_escape(channel['copyrightHolder'])}. All rights reserved.</copyright>\n")
+        f.write(
+            f"    <image>\n"
+            f"      <url>{SITE_DOMAIN}{channel['imagePath']}</url>\n"
+            f"      <title>{xml_escape(channel['imageTitle'])}</title>\n"
+            f"      <link>{SITE_DOMAIN}</link>\n"
+            f"    </image>\n"
+        )
+
+        for post in items:
+            post_url = f"{SITE_DOMAIN}/blog/{xml_escape(post['slug'])}"
+            f.write(
+                f"    <item>\n"
+                f"      <title>{xml_escape(post['title'])}</title>\n"
+                f"      <link>{post_url}</link>\n"
+                f"      <guid isPermaLink=\"true\">{post_url}</guid>\n"
+                f"      <description>{xml_escape(post['description'])}</description>\n"
+                f"      <pubDate>{rfc822_date(post['publishedAt'])}</pubDate>\n"
+                f"      <dc:creator>{xml_escape(post['author'])}</dc:creator>\n"
+                f"      <category>{xml_escape(post['category'])}</category>\n"
+            )
+            for tag in post['tags']:
+                f.write(f"      <category>{xml_escape(tag)}</category>\n")
+            if post['coverImage']:
+                # RSS 2.0 requires a length; the real file size is not tracked
+                f.write(f'      <enclosure url="{xml_escape(post["coverImage"])}" type="image/jpeg" length="100000"/>\n')
+            f.write("    </item>\n")
+
+        f.write('  </channel>\n')
+        f.write('</rss>\n')
+    print(f"[OK] RSS feed saved: {rss_path} ({len(items)} items)")
+    return rss_path
+
+def outputs_current(state):
+    """True when every recorded output is on disk unchanged and no other sitemap shards exist"""
+    outputs = state.get('outputs', {})
+    if 'sitemap.xml' not in outputs or 'rss.xml' not in outputs:
+        return False
+    shards = {p.name for p in public_dir.glob('sitemap-*.xml')}
+    if shards != {name for name in outputs if name.startswith('sitemap-')}:
+        return False
+    for name, digest in outputs.items():
+        path = public_dir / name
+        if not path.exists() or sha256_hex(path.read_bytes()) != digest:
+            return False
+    return True
+
+try:
+    previous_state = json.loads(seo_state_path.read_text(encoding='utf-8'))
+except (OSError, ValueError):
+    previous_state = {}
+
+# Markdown files this run did not write (e.g. posts from the admin panel) keep their
+# record while unchanged; new or edited ones are left for generate-seo.js to parse.
+previous_records = previous_state.get('posts', {})
+unrecorded = []
+for md_file in sorted(output_dir.glob('*.md')):
+    if md_file.name in seo_records:
+        continue
+    previous = previous_records.get(md_file.name)
+    if previous and previous['digest'] == sha256_hex(md_file.read_bytes()):
+        seo_records[md_file.name] = previous
+    else:
+        unrecorded.append(md_file.name)
+
+config_digest = sha256_hex(seo_config_bytes)
+seo_posts = sort_posts(r['post'] for r in seo_records.values() if r['post'])
+previous_posts = sort_posts(r['post'] for r in previous_records.values() if r['post'])
+
+print()
+if (previous_state.get('config') == config_digest and seo_posts == previous_posts
+        and outputs_current(previous_state)):
+    # Markdown bytes may still have changed, so the record digests are refreshed below
+    print("[SKIP] SEO files: post metadata and outputs unchanged")
+    outputs = previous_state['outputs']
+elif seo_posts:
+    # Static pages and the feed date follow the newest post, so identical input gives identical output
+    latest_update = max(p['updatedAt'] for p in seo_posts)
+    public_dir.mkdir(parents=True, exist_ok=True)
+    written_paths = write_sitemaps(seo_posts, latest_update[:10])
+    written_paths.append(write_rss(seo_posts, latest_update))
+    outputs = {path.name: sha256_hex(path.read_bytes()) for path in written_paths}
+else:
+    print("[SKIP] SEO files: no posts with a slug and publish date")
+    outputs = None
+
+if outputs is not None:
+    state = {'config': config_digest, 'posts': seo_records, 'outputs': outputs}
+    seo_state_path.write_text(json.dumps(state, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+if unrecorded:
+    print(f"[INFO] {len(unrecorded)} markdown file(s) without an SEO record; run `npm run generate:seo` to add them")
@@ -5,19 +5,26 @@
  * - npm run generate:seo
  * - 블로그 글 작성 후 자동 실행
  * - npm run build 시 자동 실행
+ *
+ * scripts/convert-blog.py와 같은 설정(scripts/seo-config.json)과 같은 상태 파일
+ * (scripts/.seo-fingerprint)을 사용하며, 두 스크립트의 출력은 바이트 단위로 동일해야 합니다.
+ * - 상태 파일에 기록된 마크다운 해시가 같은 글은 다시 파싱하지 않습니다.
+ * - 메타데이터, 설정, 출력 파일이 모두 그대로면 재생성을 건너뜁니다.
  */
 
 import fs from 'fs/promises';
 import path from 'path';
+import { createHash } from 'crypto';
 import { fileURLToPath } from 'url';
 import matter from 'gray-matter';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const SITE_DOMAIN = 'https://alphagogogo.com';
 const BLOG_DIR = path.join(__dirname, '../src/content/blog');
 const PUBLIC_DIR = path.join(__dirname, '../public');
+const SEO_CONFIG_PATH = path.join(__dirname, 'seo-config.json');
+const SEO_STATE_PATH = path.join(__dirname, '.seo-fingerprint');
 
 // 카테고리 URL 매핑
 const CATEGORY_URL_MAP = {
@@ -26,254 +33,302 @@ const CATEGORY_URL_MAP = {
   '라이프스타일': '/blog/lifestyle',
 };
 
+const sha256Hex = (data) => createHash('sha256').update(data).digest('hex');
+
+// HTML 특수문자 이스케이프
+function escapeXml(str) {
+  return String(str)
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&apos;');
+}
+
+// 마크다운/HTML을 RSS 설명용 일반 텍스트로 변환
+function stripMarkdown(md) {
+  return md
+    .replace(/```[\s\S]*?```/g, '')
+    .replace(/!\[[^\]]*\]\([^)]+\)/g, '')
+    .replace(/\[([^\]]+)\]\([^)]+\)/g, '$1')
+    .replace(/`([^`]+)`/g, '$1')
+    .replace(/<[^>]*>/g, '')
+    .replace(/[*_~>#]/g, '')
+    .replace(/\s+/g, ' ')
+    .trim();
+}
+
 /**
- * 모든 블로그 포스트 읽기
+ * frontmatter 날짜를 UTC ISO 문자열로 변환 (실패 시 null)
+ * '2025-04-23 13:38:57.694308+00' 같은 Postgres 형식도 처리
  */
-async function getAllBlogPosts() {
-  try {
-    const files = await fs.readdir(BLOG_DIR);
-    const posts = [];
-
-    for (const file of files) {
-      if (!file.endsWith('.md')) continue;
-
-      try {
-        const filePath = path.join(BLOG_DIR, file);
-        const fileContent = await fs.readFile(filePath, 'utf-8');
-        const { data: frontmatter, content: markdown } = matter(fileContent);
-
-        const slug = frontmatter.slug || file.replace(/\.md$/, '');
-
-        posts.push({
-          slug,
-          title: frontmatter.title || 'Untitled',
-          excerpt: frontmatter.excerpt || markdown.slice(0, 200) + '...',
-          content: markdown,
-          category: frontmatter.category || 'Uncategorized',
-          author: frontmatter.author || 'Anonymous',
-          publishedAt: frontmatter.date || new Date().toISOString(),
-          readTime: frontmatter.readTime || Math.ceil(markdown.length / 1000),
-          coverImage: frontmatter.coverImage || '',
-          tags: Array.isArray(frontmatter.tags) ? frontmatter.tags : [],
-        });
-      } catch (parseError) {
-        console.error(`⚠️  파싱 오류 (${file}):`, parseError.message);
-        // 개별 파일 오류는 무시하고 계속 진행
-        continue;
-      }
+function parseTimestamp(value) {
+  let date;
+  if (value instanceof Date) {
+    date = value;
+  } else if (typeof value === 'string' && value.trim()) {
+    let normalized = value.trim().replace(' ', 'T')
+      .replace(/(\.\d{3})\d+/, '$1')
+      .replace(/([+-]\d{2})$/, '$1:00');
+    if (normalized.includes('T') && !/(Z|[+-]\d{2}:\d{2})$/.test(normalized)) {
+      normalized += 'Z';
     }
+    date = new Date(normalized);
+  } else {
+    return null;
+  }
+  return Number.isNaN(date.getTime()) ? null : date.toISOString();
+}
+
+function rfc822Date(timestamp) {
+  return new Date(`${timestamp.slice(0, 19)}Z`).toUTCString();
+}
+
+function resolveCoverImage(siteDomain, coverImage) {
+  if (!coverImage) return '';
+  if (coverImage.startsWith('http')) return coverImage;
+  if (coverImage.startsWith('/')) return `${siteDomain}${coverImage}`;
+  // 상대 경로인 경우 /blog-images/ 추가
+  return `${siteDomain}/blog-images/${coverImage}`;
+}
+
+/**
+ * 마크다운 파일 하나를 SEO 레코드로 변환 (사이트맵/RSS에서 제외할 글은 null)
+ */
+function parsePostRecord(config, file, fileContent) {
+  const { data: frontmatter, content: markdown } = matter(fileContent);
 
-    // 최신순 정렬
-    posts.sort((a, b) => new Date(b.publishedAt).getTime() - new Date(a.publishedAt).getTime());
+  const publishedAt = parseTimestamp(frontmatter.date);
+  if (!publishedAt) {
+    console.error(`⚠️  날짜 오류로 SEO 파일에서 제외 (${file}): ${frontmatter.date}`);
+    return null;
+  }
 
-    console.log(`✅ ${posts.length}개의 블로그 포스트를 찾았습니다.`);
-    return posts;
+  const excerpt = String(frontmatter.excerpt || markdown.slice(0, 200) + '...');
+  let description = stripMarkdown(excerpt);
+  if (description.length > config.descriptionMaxLength) {
+    description = description.slice(0, config.descriptionMaxLength) + '...';
+  }
+
+  return {
+    slug: String(frontmatter.slug || file.replace(/\.md$/, '')),
+    title: String(frontmatter.title || 'Untitled'),
+    description,
+    category: String(frontmatter.category || config.defaultCategory),
+    author: String(frontmatter.author || config.defaultAuthor),
+    coverImage: resolveCoverImage(config.siteDomain, String(frontmatter.coverImage || '')),
+    tags: Array.isArray(frontmatter.tags) ? frontmatter.tags.map(String) : [],
+    publishedAt,
+    updatedAt: parseTimestamp(frontmatter.updatedAt) || publishedAt,
+  };
+}
+
+/**
+ * 최신순 정렬 (동일 날짜는 slug 순, convert-blog.py와 같은 순서)
+ */
+function sortPosts(posts) {
+  return [...posts]
+    .sort((a, b) => (a.slug < b.slug ? -1 : a.slug > b.slug ? 1 : 0))
+    .sort((a, b) => (a.publishedAt < b.publishedAt ? 1 : a.publishedAt > b.publishedAt ? -1 : 0));
+}
+
+async function readState() {
+  try {
+    return JSON.parse(await fs.readFile(SEO_STATE_PATH, 'utf-8'));
+  } catch {
+    return {};
+  }
+}
+
+/**
+ * 블로그 포스트 레코드 수집
+ * - 해시가 상태 파일과 같은 마크다운은 기록된 레코드를 재사용하고, 바뀐 파일만 파싱
+ * - 블로그 디렉터리를 읽을 수 없으면 null
+ */
+async function collectPostRecords(config, previousRecords) {
+  let files;
+  try {
+    files = (await fs.readdir(BLOG_DIR)).filter((file) => file.endsWith('.md')).sort();
   } catch (error) {
     console.error('❌ 블로그 포스트 읽기 오류:', error);
-    return [];
+    return null;
   }
+
+  const records = {};
+  let parsedCount = 0;
+  for (const file of files) {
+    try {
+      const fileContent = await fs.readFile(path.join(BLOG_DIR, file));
+      const digest = sha256Hex(fileContent);
+      const previous = previousRecords[file];
+      if (previous && previous.digest === digest) {
+        records[file] = previous;
+        continue;
+      }
+      records[file] = { digest, post: parsePostRecord(config, file, fileContent.toString('utf-8')) };
+      parsedCount++;
+    } catch (parseError) {
+      console.error(`⚠️  파싱 오류 (${file}):`, parseError.message);
+      // 개별 파일 오류는 무시하고 계속 진행
+    }
+  }
+
+  console.log(`✅ ${files.length}개의 블로그 포스트를 찾았습니다. (새로 파싱: ${parsedCount}개)`);
+  return records;
 }
 
 /**
- * Sitemap.xml 생성
+ * 기록된 출력 파일이 그대로이고 다른 sitemap 샤드가 없으면 true
  */
-async function generateSitemap(posts) {
-  const today = new Date().toISOString().split('T')[0];
-
-  let sitemap = `<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-  <!-- 홈페이지 -->
-  <url>
-    <loc>${SITE_DOMAIN}</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>1.0</priority>
-  </url>
-
-  <!-- 블로그 메인 -->
-  <url>
-    <loc>${SITE_DOMAIN}/blog</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.9</priority>
-  </url>
-
-  <!-- 블로그 카테고리 -->
-  <url>
-    <loc>${SITE_DOMAIN}/blog/ai-news</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.8</priority>
-  </url>
-  <url>
-    <loc>${SITE_DOMAIN}/blog/trending</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.8</priority>
-  </url>
-  <url>
-    <loc>${SITE_DOMAIN}/blog/lifestyle</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.7</priority>
-  </url>
-
-  <!-- 기타 주요 페이지 -->
-  <url>
-    <loc>${SITE_DOMAIN}/gpts</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.7</priority>
-  </url>
-  <url>
-    <loc>${SITE_DOMAIN}/services</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>monthly</changefreq>
-    <priority>0.7</priority>
-  </url>
-  <url>
-    <loc>${SITE_DOMAIN}/resources</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.8</priority>
-  </url>
-  <url>
-    <loc>${SITE_DOMAIN}/community</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.6</priority>
-  </url>
-  <url>
-    <loc>${SITE_DOMAIN}/open-chat-rooms</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>0.6</priority>
-  </url>
-  <url>
-    <loc>${SITE_DOMAIN}/business-inquiry</loc>
-    <lastmod>${today}</lastmod>
-    <changefreq>monthly</changefreq>
-    <priority>0.5</priority>
-  </url>
-
-  <!-- 개별 블로그 포스트 -->
-`;
+async function outputsCurrent(outputs) {
+  if (!outputs || !outputs['sitemap.xml'] || !outputs['rss.xml']) return false;
+  try {
+    const shards = (await fs.readdir(PUBLIC_DIR)).filter(isSitemapShard).sort();
+    const recordedShards = Object.keys(outputs).filter(isSitemapShard).sort();
+    if (shards.join('\n') !== recordedShards.join('\n')) return false;
 
+    for (const [name, digest] of Object.entries(outputs)) {
+      if (sha256Hex(await fs.readFile(path.join(PUBLIC_DIR, name))) !== digest) return false;
+    }
+  } catch {
+    return false;
+  }
+  return true;
+}
+
+function isSitemapShard(name) {
+  return /^sitemap-\d+\.xml$/.test(name);
+}
+
+function* sitemapUrls(config, posts, staticLastmod) {
+  for (const page of config.staticUrls) {
+    yield [`${config.siteDomain}${page.path}`, staticLastmod, page.changefreq, page.priority];
+  }
   for (const post of posts) {
-    const postDate = new Date(post.publishedAt).toISOString().split('T')[0];
-    sitemap += `  <url>
-    <loc>${SITE_DOMAIN}/blog/${post.slug}</loc>
-    <lastmod>${postDate}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.6</priority>
-  </url>
-`;
+    yield [`${config.siteDomain}/blog/${post.slug}`, post.updatedAt.slice(0, 10), config.post.changefreq, config.post.priority];
+  }
+}
+
+function renderUrlset(urls) {
+  const lines = [
+    '<?xml version="1.0" encoding="UTF-8"?>',
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+  ];
+  for (const [loc, lastmod, changefreq, priority] of urls) {
+    lines.push(
+      '  <url>',
+      `    <loc>${escapeXml(loc)}</loc>`,
+      `    <lastmod>${lastmod}</lastmod>`,
+      `    <changefreq>${changefreq}</changefreq>`,
+      `    <priority>${priority}</priority>`,
+      '  </url>'
+    );
   }
+  lines.push('</urlset>', '');
+  return lines.join('\n');
+}
 
-  sitemap += `</urlset>
-`;
+/**
+ * Sitemap.xml 생성 (sitemapMaxUrls 초과 시 sitemap index + sitemap-N.xml 샤드)
+ * 작성한 파일 이름 목록을 반환
+ */
+async function generateSitemap(config, posts, staticLastmod) {
+  for (const name of (await fs.readdir(PUBLIC_DIR)).filter(isSitemapShard)) {
+    await fs.unlink(path.join(PUBLIC_DIR, name));
+  }
 
+  const maxUrls = config.sitemapMaxUrls;
+  const urls = [...sitemapUrls(config, posts, staticLastmod)];
   const sitemapPath = path.join(PUBLIC_DIR, 'sitemap.xml');
-  await fs.writeFile(sitemapPath, sitemap, 'utf-8');
-  console.log(`✅ Sitemap 생성 완료: ${sitemapPath}`);
-  console.log(`   📄 총 ${posts.length + 11}개 URL 포함`);
+
+  if (urls.length <= maxUrls) {
+    await fs.writeFile(sitemapPath, renderUrlset(urls), 'utf-8');
+    console.log(`✅ Sitemap 생성 완료: ${sitemapPath}`);
+    console.log(`   📄 총 ${urls.length}개 URL 포함`);
+    return ['sitemap.xml'];
+  }
+
+  const written = ['sitemap.xml'];
+  const index = [
+    '<?xml version="1.0" encoding="UTF-8"?>',
+    '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+  ];
+  for (let start = 0, shard = 1; start < urls.length; start += maxUrls, shard++) {
+    const shardName = `sitemap-${shard}.xml`;
+    await fs.writeFile(path.join(PUBLIC_DIR, shardName), renderUrlset(urls.slice(start, start + maxUrls)), 'utf-8');
+    written.push(shardName);
+    index.push(
+      '  <sitemap>',
+      `    <loc>${config.siteDomain}/${shardName}</loc>`,
+      `    <lastmod>${staticLastmod}</lastmod>`,
+      '  </sitemap>'
+    );
+  }
+  index.push('</sitemapindex>', '');
+  await fs.writeFile(sitemapPath, index.join('\n'), 'utf-8');
+  console.log(`✅ Sitemap index 생성 완료: ${sitemapPath}`);
+  console.log(`   📄 ${written.length - 1}개 샤드, 총 ${urls.length}개 URL 포함`);
+  return written;
 }
 
 /**
- * RSS Feed 생성
+ * RSS Feed 생성 (최근 rssMaxItems개 포스트)
  */
-async function generateRSS(posts) {
-  const now = new Date();
-  const buildDate = now.toUTCString();
-
-  // 최근 20개 포스트만 RSS에 포함
-  const recentPosts = posts.slice(0, 20);
-
-  let rss = `<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:dc="http://purl.org/dc/elements/1.1/">
-  <channel>
-    <title>알파고고고 - 최신 AI 소식 &amp; 인사이트</title>
-    <link>${SITE_DOMAIN}</link>
-    <description>최신 AI 뉴스, 연구 및 인사이트로 업데이트하세요. 알파고고고는 인공지능 발전에 대한 최신 정보를 제공합니다.</description>
-    <language>ko-KR</language>
-    <lastBuildDate>${buildDate}</lastBuildDate>
-    <pubDate>${buildDate}</pubDate>
-    <ttl>60</ttl>
-    <atom:link href="${SITE_DOMAIN}/rss.xml" rel="self" type="application/rss+xml"/>
-    <managingEditor>support@alphagogogo.com (알파고고고)</managingEditor>
-    <copyright>Copyright ${now.getFullYear()} 알파고고고. All rights reserved.</copyright>
-    <image>
-      <url>${SITE_DOMAIN}/images/logo.png</url>
-      <title>알파고고고</title>
-      <link>${SITE_DOMAIN}</link>
-    </image>
-
-`;
+async function generateRSS(config, posts, buildTimestamp) {
+  const { siteDomain, channel } = config;
+  const buildDate = rfc822Date(buildTimestamp);
+  const recentPosts = posts.slice(0, config.rssMaxItems);
+
+  const lines = [
+    '<?xml version="1.0" encoding="UTF-8"?>',
+    '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:dc="http://purl.org/dc/elements/1.1/">',
+    '  <channel>',
+    `    <title>${escapeXml(channel.title)}</title>`,
+    `    <link>${siteDomain}</link>`,
+    `    <description>${escapeXml(channel.description)}</description>`,
+    `    <language>${channel.language}</language>`,
+    `    <lastBuildDate>${buildDate}</lastBuildDate>`,
+    `    <pubDate>${buildDate}</pubDate>`,
+    `    <ttl>${channel.ttl}</ttl>`,
+    `    <atom:link href="${siteDomain}/rss.xml" rel="self" type="application/rss+xml"/>`,
+    `    <managingEditor>${escapeXml(channel.managingEditor)}</managingEditor>`,
+    `    <copyright>Copyright ${buildTimestamp.slice(0, 4)} ${escapeXml(channel.copyrightHolder)}. All rights reserved.</copyright>`,
+    '    <image>',
+    `      <url>${siteDomain}${channel.imagePath}</url>`,
+    `      <title>${escapeXml(channel.imageTitle)}</title>`,
+    `      <link>${siteDomain}</link>`,
+    '    </image>',
+  ];
 
   for (const post of recentPosts) {
-    const pubDate = new Date(post.publishedAt).toUTCString();
-    const postUrl = `${SITE_DOMAIN}/blog/${post.slug}`;
-
-    // HTML 특수문자 이스케이프
-    const escapeXml = (str) => {
-      return str
-        .replace(/&/g, '&amp;')
-        .replace(/</g, '&lt;')
-        .replace(/>/g, '&gt;')
-        .replace(/"/g, '&quot;')
-        .replace(/'/g, '&apos;');
-    };
-
-    const title = escapeXml(post.title);
-    const excerpt = escapeXml(post.excerpt);
-    const author = escapeXml(post.author);
-    const category = escapeXml(post.category);
-
-    rss += `    <item>
-      <title>${title}</title>
-      <link>${postUrl}</link>
-      <guid isPermaLink="true">${postUrl}</guid>
-      <description>${excerpt}</description>
-      <pubDate>${pubDate}</pubDate>
-      <author>support@alphagogogo.com (${author})</author>
-      <category>${category}</category>
-`;
-
-    // 태그 추가
+    const postUrl = `${siteDomain}/blog/${escapeXml(post.slug)}`;
+    lines.push(
+      '    <item>',
+      `      <title>${escapeXml(post.title)}</title>`,
+      `      <link>${postUrl}</link>`,
+      `      <guid isPermaLink="true">${postUrl}</guid>`,
+      `      <description>${escapeXml(post.description)}</description>`,
+      `      <pubDate>${rfc822Date(post.publishedAt)}</pubDate>`,
+      `      <dc:creator>${escapeXml(post.author)}</dc:creator>`,
+      `      <category>${escapeXml(post.category)}</category>`
+    );
     for (const tag of post.tags) {
-      rss += `      <category>${escapeXml(tag)}</category>
-`;
+      lines.push(`      <category>${escapeXml(tag)}</category>`);
     }
-
-    // 커버 이미지가 있는 경우
     if (post.coverImage) {
-      let imageUrl;
-      if (post.coverImage.startsWith('http')) {
-        imageUrl = post.coverImage;
-      } else if (post.coverImage.startsWith('/')) {
-        imageUrl = `${SITE_DOMAIN}${post.coverImage}`;
-      } else {
-        // 상대 경로인 경우 /blog-images/ 추가
-        imageUrl = `${SITE_DOMAIN}/blog-images/${post.coverImage}`;
-      }
       // RSS 2.0 spec requires length attribute (image file size in bytes)
       // Using a default value since we don't fetch actual file sizes
-      rss += `      <enclosure url="${imageUrl}" type="image/jpeg" length="100000"/>
-`;
+      lines.push(`      <enclosure url="${escapeXml(post.coverImage)}" type="image/jpeg" length="100000"/>`);
     }
-
-    rss += `    </item>
-`;
+    lines.push('    </item>');
   }
-
-  rss += `  </channel>
-</rss>
-`;
+  lines.push('  </channel>', '</rss>', '');
 
   const rssPath = path.join(PUBLIC_DIR, 'rss.xml');
-  await fs.writeFile(rssPath, rss, 'utf-8');
+  await fs.writeFile(rssPath, lines.join('\n'), 'utf-8');
   console.log(`✅ RSS Feed 생성 완료: ${rssPath}`);
   console.log(`   📄 최근 ${recentPosts.length}개 포스트 포함`);
+  return 'rss.xml';
 }
 
 /**
@@ -282,22 +337,53 @@ async function generateRSS(posts) {
 async function main() {
   console.log('\n🚀 SEO 파일 생성 시작...\n');
 
-  const posts = await getAllBlogPosts();
+  const configBytes = await fs.readFile(SEO_CONFIG_PATH);
+  const config = JSON.parse(configBytes.toString('utf-8'));
+  const configDigest = sha256Hex(configBytes);
+
+  const previousState = await readState();
+  const previousRecords = previousState.posts || {};
+  const records = await collectPostRecords(config, previousRecords);
+  if (!records) return;
+
+  const posts = sortPosts(Object.values(records).map((r) => r.post).filter(Boolean));
+  const previousPosts = sortPosts(Object.values(previousRecords).map((r) => r.post).filter(Boolean));
 
   if (posts.length === 0) {
     console.log('⚠️  블로그 포스트가 없습니다.');
     return;
   }
 
-  await generateSitemap(posts);
-  await generateRSS(posts);
+  let outputs;
+  if (
+    previousState.config === configDigest &&
+    JSON.stringify(posts) === JSON.stringify(previousPosts) &&
+    (await outputsCurrent(previousState.outputs))
+  ) {
+    console.log('⏭️  블로그 글 메타데이터와 SEO 파일이 변경되지 않았습니다. 재생성을 건너뜁니다.\n');
+    outputs = previousState.outputs;
+  } else {
+    // 정적 페이지 lastmod와 피드 날짜는 가장 최근 수정일 기준 (같은 입력이면 같은 출력)
+    const latestUpdate = posts.map((post) => post.updatedAt).sort().at(-1);
+    const written = await generateSitemap(config, posts, latestUpdate.slice(0, 10));
+    written.push(await generateRSS(config, posts, latestUpdate));
+
+    outputs = {};
+    for (const name of written) {
+      outputs[name] = sha256Hex(await fs.readFile(path.join(PUBLIC_DIR, name)));
+    }
+
+    console.log('\n✅ SEO 파일 생성 완료!\n');
+    console.log(`📊 통계:`);
+    console.log(`   - 블로그 포스트: ${posts.length}개`);
+    console.log(`   - Sitemap URL: ${posts.length + config.staticUrls.length}개`);
+    console.log(`   - RSS 항목: ${Math.min(posts.length, config.rssMaxItems)}개`);
+    console.log('');
+  }
 
-  console.log('\n✅ SEO 파일 생성 완료!\n');
-  console.log(`📊 통계:`);
-  console.log(`   - 블로그 포스트: ${posts.length}개`);
-  console.log(`   - Sitemap URL: ${posts.length + 11}개`);
-  console.log(`   - RSS 항목: ${Math.min(posts.length, 20)}개`);
-  console.log('');
+  // 마크다운 해시가 바뀌었을 수 있으므로 건너뛴 경우에도 상태 파일 갱신
+  const state = { config: configDigest, posts: records, outputs };
+  await fs.writeFile(SEO_STATE_PATH, JSON.stringify(state, null, 2) + '\n', 'utf-8');
 }
 
 // 스크립트 실행
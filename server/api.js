@@ -229,7 +229,7 @@ ${content}`;
     try {
       const safeTitle = sanitizeCommitMessage(title);
       // 블로그 글과 관련된 모든 파일 추가 (이미지 포함)
-      await execAsync(`cd "${path.join(__dirname, '..')}" && git add src/content/blog/${markdownFilename} public/sitemap.xml public/rss.xml public/images/blog/`);
+      await execAsync(`cd "${path.join(__dirname, '..')}" && git add -A -- src/content/blog/${markdownFilename} 'public/sitemap*.xml' public/rss.xml public/images/blog/`);
       await execAsync(`cd "${path.join(__dirname, '..')}" && git commit -m "feat: Add new blog post - ${safeTitle}
 
 🤖 Generated via Admin Panel
@@ -348,7 +348,7 @@ ${content}`;
     try {
       const safeTitle = sanitizeCommitMessage(title);
       const filename = path.basename(targetFile);
-      await execAsync(`cd "${path.join(__dirname, '..')}" && git add src/content/blog/${filename} public/sitemap.xml public/rss.xml`);
+      await execAsync(`cd "${path.join(__dirname, '..')}" && git add -A -- src/content/blog/${filename} 'public/sitemap*.xml' public/rss.xml`);
       await execAsync(`cd "${path.join(__dirname, '..')}" && git commit -m "feat: Update blog post - ${safeTitle}
 
 Updated: ${filename}